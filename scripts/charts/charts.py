@@ -1,10 +1,13 @@
 """Module to create the chart data for the page"""
 
+import os
+from functools import lru_cache
+
 import pandas as pd
 import country_converter as coco
 import numpy as np
 
-from scripts.config import Paths
+from scripts.config import Outputs, Paths
 from scripts.utils import custom_sort, add_gni, add_gni_pc
 
 
@@ -13,6 +16,15 @@ inflows_data = pd.read_csv(Paths.raw_data / "total_inflows.csv")
 outflows_avg_data = pd.read_csv(Paths.raw_data / "debt_service_by_period.csv")
 net_flows_scenarios_data = pd.read_csv(Paths.raw_data / "net_flows_scenarios.csv")
 
+# country converter shared by every chart
+_CC = coco.CountryConverter()
+
+
+@lru_cache(maxsize=None)
+def _iso3(country: str) -> str:
+    """Convert a country name to ISO3, caching the result across charts"""
+    return _CC.convert(country, to="ISO3")
+
 
 def chart_1():
     """Create data for chart 1: net flows comparison with/without concessional finance"""
@@ -21,7 +33,10 @@ def chart_1():
         net_flows_data
         # .pipe(add_africa_aggregate)
         # .pipe(add_income_level_aggregates)
-        .loc[lambda d: d.indicator_type == "net_flow"]
+        .loc[
+            lambda d: d.indicator_type == "net_flow",
+            ["year", "country", "flow_type", "value"],
+        ]
         .pivot(index=["year", "country"], columns="flow_type", values="value")
         .reset_index()
         .pipe(
@@ -46,7 +61,7 @@ def chart_1():
             }
         )
         .assign(unit="current US$")
-        .to_csv(Paths.output / "chart_1_download.csv", index=False)
+        .to_csv(Outputs.chart_1_download, index=False)
     )
 
     # chart data
@@ -56,7 +71,7 @@ def chart_1():
                 "all": "all net flows",
                 "excluding_concessional": "net flows excluding concessional finance",
             }
-        ).to_csv(Paths.output / "chart_1.csv", index=False)
+        ).to_csv(Outputs.chart_1, index=False)
     )
 
 
@@ -70,7 +85,7 @@ def chart_2():
             & (d.year == 2023),
             ["year", "country", "income_level", "value", "flow_type"],
         ]
-        .assign(entity_code=lambda d: coco.CountryConverter().pandas_convert(d.country))
+        .assign(entity_code=lambda d: d.country.map(_iso3))
         .pipe(add_gni)
         .assign(value_pct_gni=lambda d: (d.value / d.gni) * 100)
         .pipe(add_gni_pc)
@@ -95,31 +110,28 @@ def chart_2():
                 "value": "net flows (current US$)",
                 "gni": "GNI, Atlas method (current US$)",
             }
-        ).to_csv(Paths.output / "chart_2_download.csv", index=False)
+        ).to_csv(Outputs.chart_2_download, index=False)
     )
 
     # chart data
-    (
-        pd.concat(
-            [
-                pd.DataFrame(
-                    [[""] * 1], columns=["country"]
-                ),  # add an empty row at the top
-                df,
-            ]
-        )
-        .assign(value=lambda d: round(d.value / 1e9, 2))
-        .to_csv(Paths.output / "chart_2.csv", index=False)
+    chart = df.filter(["country", *df.columns.drop("country")]).assign(
+        value=lambda d: d.value.div(1e9).round(2)
     )
 
+    # add an empty row at the top, written straight after the header. Rows end
+    # with os.linesep, the line terminator to_csv uses for the other charts.
+    with open(Outputs.chart_2, "w", newline="") as f:
+        chart.head(0).to_csv(f, index=False)
+        f.write("," * (len(chart.columns) - 1) + os.linesep)
+        chart.to_csv(f, index=False, header=False)
+
 
 def chart_3():
     """Line chart new debt inflows"""
 
     df = (
-        inflows_data.pivot(
-            index=["year", "country"], columns="counterpart_type", values="value"
-        )
+        inflows_data.filter(["year", "country", "counterpart_type", "value"])
+        .pivot(index=["year", "country"], columns="counterpart_type", values="value")
         .reset_index()
         .pipe(
             custom_sort,
@@ -134,28 +146,37 @@ def chart_3():
         )
     )
 
-    df.to_csv(Paths.output / "chart_3.csv", index=False)
-    df.assign(prices="current").to_csv(Paths.output / "chart_3_data.csv", index=False)
+    df.to_csv(Outputs.chart_3, index=False)
+    df.assign(prices="current").to_csv(Outputs.chart_3_data, index=False)
 
 
 def chart_4():
     """ """
 
-    o1 = outflows_avg_data.loc[
-        lambda d: d.period.isin(["2010-2014", "2018-2022"])
-    ].assign(code=lambda d: d.counterpart_type + " " + "data")
-
-    o2 = outflows_avg_data.loc[
-        lambda d: d.period.isin(["2018-2022", "2024-2025 (projected)"])
-    ].assign(code=lambda d: d.counterpart_type)
-
+    # historical periods go to "<type> data" columns, recent/projected to "<type>"
     df = (
-        pd.concat([o1, o2])
+        outflows_avg_data.loc[
+            lambda d: d.period.isin(["2010-2014", "2018-2022", "2024-2025 (projected)"])
+        ]
+        .assign(
+            code=lambda d: d.counterpart_type,
+            data=lambda d: d.value.where(d.period.isin(["2010-2014", "2018-2022"])),
+            value=lambda d: d.value.where(
+                d.period.isin(["2018-2022", "2024-2025 (projected)"])
+            ),
+        )
         .pivot(
             index=["country", "period", "counterpart_type"],
             columns="code",
-            values="value",
+            values=["value", "data"],
+        )
+        .pipe(
+            lambda d: d.set_axis(
+                [f"{code} data" if v == "data" else code for v, code in d.columns],
+                axis=1,
+            )
         )
+        .sort_index(axis=1)
         .reset_index()
         .pipe(
             custom_sort,
@@ -169,12 +190,12 @@ def chart_4():
             ],
         )
     )
-    df.to_csv(Paths.output / "chart_4.csv", index=False)
+    df.to_csv(Outputs.chart_4, index=False)
 
     # download data
     outflows_avg_data.loc[
         :, ["period", "country", "counterpart_type", "prices", "value"]
-    ].to_csv(Paths.output / "chart_4_download.csv", index=False)
+    ].to_csv(Outputs.chart_4_download, index=False)
 
 
 def chart_5():
@@ -202,7 +223,7 @@ def chart_5():
     )
 
     # download data
-    df.to_csv(Paths.output / "chart_5.csv", index=False)
+    df.to_csv(Outputs.chart_5, index=False)
 
     # chart data
     (
@@ -229,7 +250,7 @@ def chart_5():
                 "Upper middle income",
             ],
         )
-        .to_csv(Paths.output / "chart_5.csv", index=False)
+        .to_csv(Outputs.chart_5, index=False)
     )
 
 
@@ -246,7 +267,7 @@ def chart_6():
             & (d.year == 2023)
             & (d.indicator_type == "net_flow")
         ]
-        .assign(entity_code=lambda d: coco.CountryConverter().pandas_convert(d.country))
+        .assign(entity_code=lambda d: d.country.map(_iso3))
         .pipe(add_gni)
         .assign(value_pct_gni=lambda d: (d.value / d.gni) * 100)
         .assign(
@@ -267,7 +288,7 @@ def chart_6():
                 "gni": "GNI, Atlas method (current US$)",
                 "value": "net flows (current US$)",
             }
-        ).to_csv(Paths.output / "chart_6_download.csv", index=False)
+        ).to_csv(Outputs.chart_6_download, index=False)
     )
 
     # chart data
@@ -278,8 +299,8 @@ def chart_6():
             "income_level",
             ["Upper middle income", "Lower middle income", "Low income"],
         )
-        .assign(value=lambda d: round(d.value / 1e9, 2))
-        .to_csv(Paths.output / "chart_6.csv", index=False)
+        .assign(value=lambda d: d.value.div(1e9).round(2))
+        .to_csv(Outputs.chart_6, index=False)
     )
 
 
@@ -1,5 +1,10 @@
 from pathlib import Path
 
+import pandas as pd
+
+# Copy-on-Write: derived frames share data with their parents until modified
+pd.set_option("mode.copy_on_write", True)
+
 
 class Paths:
     """Class to store the paths to the data and output folders."""
@@ -11,5 +16,21 @@ class Paths:
     models = scripts / "models"
 
 
+class Outputs:
+    """Class to store the paths to the chart output files, as strings."""
+
+    chart_1 = str(Paths.output / "chart_1.csv")
+    chart_1_download = str(Paths.output / "chart_1_download.csv")
+    chart_2 = str(Paths.output / "chart_2.csv")
+    chart_2_download = str(Paths.output / "chart_2_download.csv")
+    chart_3 = str(Paths.output / "chart_3.csv")
+    chart_3_data = str(Paths.output / "chart_3_data.csv")
+    chart_4 = str(Paths.output / "chart_4.csv")
+    chart_4_download = str(Paths.output / "chart_4_download.csv")
+    chart_5 = str(Paths.output / "chart_5.csv")
+    chart_6 = str(Paths.output / "chart_6.csv")
+    chart_6_download = str(Paths.output / "chart_6_download.csv")
+
+
 CONSTANT_BASE_YEAR = 2024
 ANALYSIS_YEARS: tuple = (2000, 2024)
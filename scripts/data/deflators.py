@@ -1,5 +1,7 @@
+from functools import lru_cache
 from typing import Literal
 
+import numpy as np
 import pandas as pd
 from bblocks import (
     add_iso_codes_column,
@@ -15,38 +17,44 @@ set_bblocks_data_path(config.Paths.raw_data)
 
 def calculate_growth_rate(data: pd.DataFrame) -> pd.DataFrame:
     return data.assign(
-        value=lambda d: d.groupby("iso_code", dropna=False)["value"].pct_change()
+        value=lambda d: d.groupby("iso_code", dropna=False, observed=True, sort=False)[
+            "value"
+        ].pct_change()
     ).dropna(subset=["value"])
 
 
 def calculate_deflator(data: pd.DataFrame) -> pd.DataFrame:
-    data = data.copy(deep=True)
+    growth = (1 + data["value"]).groupby(
+        data["iso_code"], dropna=False, observed=True, sort=False
+    )
 
-    data["value"] = data.groupby("iso_code", dropna=False, observed=True)[
-        "value"
-    ].transform(lambda x: (1 + x).cumprod())
-
-    return data
+    return data.assign(value=growth.cumprod())
 
 
 def rebase_value(data: pd.DataFrame, year: int) -> pd.DataFrame:
-    data["value"] = data.groupby("iso_code")["value"].transform(
-        lambda x: x / x.loc[data.year == year].sum()
+    base = (
+        data["value"]
+        .where(data["year"] == year)
+        .groupby(data["iso_code"], observed=True, sort=False)
+        .transform("sum")
     )
 
-    return data
+    return data.assign(value=data["value"] / base)
 
 
+@lru_cache(maxsize=None)
 def _get_weo_indicator(indicator: str) -> pd.DataFrame:
     weo = WorldEconomicOutlook()
 
     weo.load_data(indicator)
 
+    # filter the rows first, then narrow the types of the remaining key columns
     return (
         weo.get_data()
-        .assign(year=lambda d: d.year.dt.year)
         .dropna(subset=["iso_code"])
-        .loc[lambda d: d.year >= config.ANALYSIS_YEARS[0]]
+        .loc[lambda d: d.year.dt.year >= config.ANALYSIS_YEARS[0]]
+        .assign(year=lambda d: d.year.dt.year.astype("int16"))
+        .astype({"iso_code": "category"})
     )
 
 
@@ -83,77 +91,95 @@ def extend_deflators_to_year(
     max year in the data and the last year specified in the arguments. The value is
     rolling average of the previous 3 years"""
 
-    def fill_with_rolling_average(
-        idx, group: pd.DataFrame, rolling_window: int = 3
-    ) -> pd.DataFrame:
-        # calculate yearly diff
-        group["yearly_diff"] = group["value"].diff()
+    # number each iso_code group, following the order of a sorted groupby
+    group = data.groupby("iso_code", dropna=False, observed=True).ngroup().to_numpy()
 
-        new_index = pd.Index(
-            range(group.year.max() - rolling_window, last_year + 1), name="year"
-        )
-
-        new_df = group.set_index("year").reindex(new_index)
-        new_df["yearly_diff"] = (
-            new_df["yearly_diff"].rolling(window=rolling_window).mean()
-        )
-        new_df["yearly_diff"] = new_df["yearly_diff"].ffill()
-        new_df["value"] = new_df.value.fillna(
-            (new_df["value"].shift(1).ffill() + new_df["yearly_diff"].shift(1).cumsum())
-        )
-
-        new_df = new_df.drop(columns=["yearly_diff"])
-        group = group.drop(columns=["yearly_diff"])
-
-        new_df[["iso_code"]] = idx
-
-        new_df = new_df.loc[lambda d: d.index > group.year.max()]
+    data = data.assign(
+        _group=group,
+        yearly_diff=lambda d: d.groupby("_group", sort=False)["value"].diff(),
+    )
 
-        group = group
-        new_df = new_df.reset_index()
+    # build a grid of years for each group, from the rolling window before its max
+    # year to the last year
+    max_year = data.groupby("_group", sort=False)["year"].max()
+    start = max_year.to_numpy() - rolling_window
+    length = np.clip(last_year + 1 - start, 0, None)
+    offsets = np.arange(length.sum()) - np.repeat(np.cumsum(length) - length, length)
+
+    grid = pd.DataFrame(
+        {
+            "_group": np.repeat(max_year.index.to_numpy(), length),
+            "year": np.repeat(start, length) + offsets,
+        }
+    ).merge(
+        data.filter(["_group", "year", "value", "yearly_diff"]),
+        on=["_group", "year"],
+        how="left",
+    )
 
-        group = pd.concat([group, new_df], ignore_index=False)
-        return group
+    # rolling average of the yearly diff, carried forward to the new years
+    by_group = grid.groupby("_group", sort=False)
+    grid["yearly_diff"] = (
+        by_group["yearly_diff"]
+        .rolling(window=rolling_window)
+        .mean()
+        .reset_index(level=0, drop=True)
+    )
+    grid["yearly_diff"] = grid.groupby("_group", sort=False)["yearly_diff"].ffill()
 
-    data = data
+    # previous known value plus the accumulated average diffs
+    by_group = grid.groupby("_group", sort=False)
+    previous = by_group["value"].shift(1).groupby(grid["_group"], sort=False).ffill()
+    accumulated = (
+        by_group["yearly_diff"].shift(1).groupby(grid["_group"], sort=False).cumsum()
+    )
+    grid["value"] = grid["value"].fillna(previous + accumulated)
 
-    dfs = []
+    # keep only the years after the max year of each group
+    grid = grid.loc[lambda d: d.year > max_year.reindex(d["_group"]).to_numpy()]
 
-    for group_idx, group_data in data.groupby(
-        ["iso_code"], dropna=False, observed=True
-    ):
-        dfs.append(
-            fill_with_rolling_average(
-                idx=group_idx, group=group_data, rolling_window=rolling_window
-            )
-        )
+    # identify the new rows by the iso_code of their group
+    first_rows = data.drop_duplicates("_group").set_index("_group")["iso_code"]
+    new_rows = grid.filter(["_group", "year", "value"]).assign(
+        iso_code=lambda d: first_rows.reindex(d["_group"]).to_numpy()
+    )
 
-    return pd.concat(dfs, ignore_index=True)
+    # append the new rows after the existing rows of each group
+    return (
+        pd.concat([data, new_rows], ignore_index=True)
+        .sort_values("_group", kind="stable")
+        .drop(columns=["_group", "yearly_diff"])
+        .reset_index(drop=True)
+    )
 
 
 def future_exchange_deflators(base_year: int = 2023) -> pd.DataFrame:
     weo = WorldEconomicOutlook()
     weo.load_data(["NGDPD", "NGDP"])
 
-    national = weo.get_data("NGDP").filter(["iso_code", "year", "value"])
-    dollars = weo.get_data("NGDPD").filter(["iso_code", "year", "value"])
+    def _values(indicator: str, name: str) -> pd.Series:
+        return (
+            weo.get_data(indicator)
+            .assign(year=lambda d: d.year.dt.year.astype("int16"))
+            .set_index(["iso_code", "year"])["value"]
+            .rename(name)
+        )
 
-    data = national.merge(dollars, on=["year", "iso_code"], suffixes=("_lcu", "_usd"))
-    data["year"] = data["year"].dt.year
+    data = (
+        _values("NGDP", "value_lcu")
+        .to_frame()
+        .join(_values("NGDPD", "value_usd"), how="inner")
+    )
 
     data["exchange"] = data["value_usd"] / data["value_lcu"]
 
-    base_data = (
-        data.loc[lambda d: d.year == base_year]
-        .filter(["iso_code", "exchange"])
-        .rename(columns={"exchange": "base_exchange"})
-    )
+    base_data = data["exchange"].xs(base_year, level="year").rename("base_exchange")
 
-    data = data.merge(base_data, on=["iso_code"])
+    data = data.join(base_data, on="iso_code", how="inner")
 
     data["exchange_deflator"] = 100 * data["exchange"] / data["base_exchange"]
 
-    return data.filter(["year", "iso_code", "exchange_deflator"])
+    return data.reset_index().filter(["year", "iso_code", "exchange_deflator"])
 
 
 def get_future_gni(
@@ -163,21 +189,35 @@ def get_future_gni(
 ) -> pd.DataFrame:
 
     max_in_data = gni_data.year.max()
-    latest = gni_data.loc[lambda d: d.year == max_in_data].filter(["iso_code", "value"])
+    latest = gni_data.loc[lambda d: d.year == max_in_data].set_index("iso_code")[
+        "value"
+    ]
 
     if prices == "constant":
         growth = constant_gdp_growth_index(base=base_year)
     else:
         growth = get_current_gdp(base=base_year)
 
-    growth = growth.loc[lambda d: d.year > max_in_data].rename(
-        columns={"value": "growth_ratio"}
+    # keep the future years of the iso_codes with a latest GNI value
+    growth = growth.loc[
+        lambda d: (d.year > max_in_data) & d.iso_code.isin(latest.index)
+    ].rename(columns={"value": "growth_ratio"})
+
+    # look up the latest GNI (through object keys, so the result isn't categorical)
+    latest_gni = growth["iso_code"].astype("object").map(latest)
+    growth[f"{prices}_usd_gni"] = latest_gni * growth["growth_ratio"]
+
+    return growth.filter(["year", "iso_code", f"{prices}_usd_gni"]).reset_index(
+        drop=True
     )
 
-    growth = growth.merge(latest, on=["iso_code"])
-    growth[f"{prices}_usd_gni"] = growth["value"] * growth["growth_ratio"]
 
-    return growth.filter(["year", "iso_code", f"{prices}_usd_gni"])
+@lru_cache(maxsize=1)
+def _iso3_codes() -> frozenset:
+    """All the ISO3 codes known to country_converter"""
+    import country_converter as coco
+
+    return frozenset(coco.CountryConverter().data["ISO3"])
 
 
 def _get_oda_indicator(
@@ -195,11 +235,13 @@ def _get_oda_indicator(
 
     data = oda.get_data()
 
+    # Unmatched donor codes are passed through as they are, so keep only the rows
+    # that converted to an ISO3 code
     data = data.pipe(
         add_iso_codes_column, id_column="donor_code", id_type="DACCode"
-    ).loc[lambda d: d.iso_code.str.len() == 3]
+    ).loc[lambda d: d.iso_code.isin(_iso3_codes())]
 
-    return data
+    return data.astype({"iso_code": "category"})
 
 
 def current_deflator_series(
@@ -270,15 +312,17 @@ def constant_deflator_series(
     # Unique iso_codes
     iso_codes = gni["iso_code"].unique()
 
-    # Create a dataframe with the Cartesian product of years and iso_codes
-    data = pd.DataFrame(
-        index=pd.MultiIndex.from_product(
-            [range(start_year, end_year + 1), iso_codes], names=["year", "iso_code"]
-        )
-    ).reset_index()
+    # Create a dataframe with the Cartesian product of years and iso_codes, with a
+    # 'value' column. Years are the outer level, as in a product of years and codes
+    years = np.arange(start_year, end_year + 1)
 
-    # Add 'value' column
-    data["value"] = 100
+    data = pd.DataFrame(
+        {
+            "year": np.repeat(years, len(iso_codes)),
+            "iso_code": np.tile(iso_codes, len(years)),
+            "value": 100,
+        }
+    )
 
     # Deflate usd
     usd_data = (
@@ -1,5 +1,9 @@
 """DEBT INFLOWS FROM IDS AND GRANTS INFLOWS FROM ODA DATA"""
 
+import shutil
+from functools import lru_cache
+
+import numpy as np
 import pandas as pd
 from bblocks import set_bblocks_data_path, DebtIDS, add_income_level_column
 from oda_data import ODAData, set_data_path, donor_groupings
@@ -9,10 +13,10 @@ from scripts.data.common import (
     clean_debtors,
     clean_creditors,
     add_oecd_names,
-    remove_counterpart_totals,
-    remove_groupings_and_totals_from_recipients,
-    remove_non_official_counterparts,
-    filter_and_assign_indicator,
+    is_official_counterpart,
+    is_recipient_country,
+    is_total,
+    filter_and_assign_indicators,
     get_concessional_non_concessional,
     add_counterpart_type,
 )
@@ -39,25 +43,31 @@ def clean_grants_inflows_output(data: pd.DataFrame) -> pd.DataFrame:
 
     Cleans the given input DataFrame by performing the following operations:
         - Adds OECD names to the data.
-        - Removes non-official counterparts from the data.
-        - Removes groupings and totals from the recipients.
+        - Removes non-official counterparts, groupings and totals from the recipients,
+          and counterpart totals from the data, in a single filter.
         - Cleans debtor values for recipients.
         - Cleans creditor values for donors.
         - Filters the columns to only include "year", "iso_code", "recipient",
           "continent", "donor", "counterpart_iso_code", "prices", and "value".
         - Renames the columns "donor" to "counterpart_area" and "recipient" to "country".
-        - Removes counterpart totals from the data.
 
     Args:
        - data : pd.DataFrame
     """
 
+    data = add_oecd_names(data)
+
+    # Keep official counterparts and developing country recipients, and drop the
+    # counterpart totals, with a single combined filter
+    data = data.loc[
+        is_official_counterpart(data)
+        & is_recipient_country(data)
+        & ~is_total(data["donor"])
+    ]
+
     # Pipeline
     data = (
-        data.pipe(add_oecd_names)
-        .pipe(remove_non_official_counterparts)
-        .pipe(remove_groupings_and_totals_from_recipients)
-        .pipe(assign_grants_indicator)
+        data.pipe(assign_grants_indicator)
         .pipe(add_counterpart_type)
         .pipe(clean_debtors, column="recipient")
         .pipe(clean_creditors, column="donor")
@@ -76,7 +86,6 @@ def clean_grants_inflows_output(data: pd.DataFrame) -> pd.DataFrame:
             ]
         )
         .rename(columns={"donor": "counterpart_area", "recipient": "country"})
-        .pipe(remove_counterpart_totals)
         .assign(value=lambda d: d.value * 1e6)  # to units
         .pipe(add_income_level_column, id_column="iso_code", id_type="ISO3")
     )
@@ -110,35 +119,25 @@ def get_debt_inflows(constant: bool = False) -> pd.DataFrame:
     )
 
     # Load bonds, banks, and other private
+    private_indicators = {
+        disbursements_indicators[name]: name
+        for name in ["bonds", "banks", "other_private"]
+    }
     ids = DebtIDS().load_data(
-        indicators=[
-            disbursements_indicators["bonds"],
-            disbursements_indicators["banks"],
-            disbursements_indicators["other_private"],
-        ],
+        indicators=list(private_indicators),
         start_year=config.ANALYSIS_YEARS[0],
         end_year=config.ANALYSIS_YEARS[1],
     )
 
-    # Get bonds data
-    bonds = ids.get_data(disbursements_indicators["bonds"]).pipe(
-        filter_and_assign_indicator, "bonds"
-    )
-
-    # Get banks data
-    banks = ids.get_data(disbursements_indicators["banks"]).pipe(
-        filter_and_assign_indicator, "banks"
-    )
-
-    # Get other private data
-    other_private = ids.get_data(disbursements_indicators["other_private"]).pipe(
-        filter_and_assign_indicator, "other_private"
+    # Get bonds, banks and other private data in one call
+    private = ids.get_data(list(private_indicators)).pipe(
+        filter_and_assign_indicators, private_indicators
     )
 
     # combine
-    data = pd.concat(
-        [bilateral, multilateral, bonds, banks, other_private], ignore_index=True
-    ).pipe(clean_debt_output)
+    data = pd.concat([bilateral, multilateral, private], ignore_index=True).pipe(
+        clean_debt_output
+    )
 
     if constant:
         data = to_constant_prices(data, config.CONSTANT_BASE_YEAR)
@@ -148,6 +147,12 @@ def get_debt_inflows(constant: bool = False) -> pd.DataFrame:
     return data
 
 
+@lru_cache(maxsize=1)
+def _bilateral_codes() -> frozenset:
+    """The donor_codes that are bilateral (from oda_data)"""
+    return frozenset(donor_groupings()["all_bilateral"])
+
+
 def assign_grants_indicator(data: pd.DataFrame) -> pd.DataFrame:
     """
     Split the grants data into bilateral and multilateral.
@@ -159,12 +164,13 @@ def assign_grants_indicator(data: pd.DataFrame) -> pd.DataFrame:
         pd.DataFrame: A new data frame containing the split grants data.
 
     """
-    # Get the donor_codes that are bilateral
-    bilateral = {c: "grants_bilateral" for c in donor_groupings()["all_bilateral"]}
-
-    # Map bilateral donors to "grants_bilateral" and fill the rest with "grants_multilateral"
+    # Flag bilateral donors as "grants_bilateral" and the rest as "grants_multilateral"
     data = data.assign(
-        indicator=lambda d: d.donor_code.map(bilateral).fillna("grants_multilateral")
+        indicator=lambda d: np.where(
+            d.donor_code.isin(_bilateral_codes()),
+            "grants_bilateral",
+            "grants_multilateral",
+        )
     )
 
     return data
@@ -227,14 +233,32 @@ def get_total_inflows(constant: bool = False) -> pd.DataFrame:
 
 def export_debt_inflows(constant: bool = False):
     """
-    Export debt inflows data to a csv file.
+    Export debt inflows data to a parquet dataset, partitioned by year.
+
+    The output is the directory output/debt_inflows_country (one year=... folder
+    per year), not a debt_inflows_country.parquet file. Reading it back with
+    pd.read_parquet returns year as a partition (dictionary/categorical) column.
 
     Args:
         constant (bool): Whether to export the data in constant or current prices.
 
     """
     data = get_debt_inflows(constant)
-    data.to_parquet(config.Paths.output / "debt_inflows_country.parquet")
+
+    # Remove the previous export, so years no longer in the data don't linger
+    path = config.Paths.output / "debt_inflows_country"
+    if path.exists():
+        shutil.rmtree(path)
+
+    # Partition by year, so readers can skip the years they don't need. Sorting by
+    # iso_code keeps repeated values together, which compresses better.
+    data.sort_values(["iso_code"], kind="stable").to_parquet(
+        path,
+        engine="pyarrow",
+        compression="zstd",
+        partition_cols=["year"],
+        index=False,
+    )
 
 
 if __name__ == "__main__":
@@ -5,7 +5,7 @@ from bblocks import set_bblocks_data_path, DebtIDS
 
 from scripts import config
 from scripts.data.common import (
-    filter_and_assign_indicator,
+    filter_and_assign_indicators,
     get_concessional_non_concessional,
 )
 from scripts.utils import clean_debt_output, to_constant_prices
@@ -31,6 +31,25 @@ outflow_indicators: dict = {
 PROJECTIONS_YEARS: int = 4
 
 
+def _get_private_debt_service(start_year: int, end_year: int) -> pd.DataFrame:
+    """Get the bonds, banks and other private debt service data."""
+    private_indicators = {
+        outflow_indicators[f"{name}_{flow}"]: name
+        for name in ["bonds", "banks", "other_private"]
+        for flow in ["amt", "int"]
+    }
+    ids = DebtIDS().load_data(
+        indicators=list(private_indicators),
+        start_year=start_year,
+        end_year=end_year,
+    )
+
+    # Get bonds, banks and other private data in one call
+    return ids.get_data(list(private_indicators)).pipe(
+        filter_and_assign_indicators, private_indicators
+    )
+
+
 def get_debt_service_data(constant: bool = False) -> pd.DataFrame:
     """
     Retrieve debt service data to bilateral, multilateral,
@@ -42,71 +61,26 @@ def get_debt_service_data(constant: bool = False) -> pd.DataFrame:
         pd.DataFrame: DataFrame containing debt service data.
 
     """
-    # get bilateral amt data, split by concessional and non-concessional
-    bilateral_amt = get_concessional_non_concessional(
-        start_year=config.ANALYSIS_YEARS[0],
-        end_year=config.ANALYSIS_YEARS[1] + PROJECTIONS_YEARS,
-        total_indicator=outflow_indicators["bilateral_amt"][0],
-        concessional_indicator=outflow_indicators["bilateral_amt"][1],
-        indicator_prefix="bilateral",
-    )
-    # get bilateral int data, split by concessional and non-concessional
-    bilateral_int = get_concessional_non_concessional(
-        start_year=config.ANALYSIS_YEARS[0],
-        end_year=config.ANALYSIS_YEARS[1] + PROJECTIONS_YEARS,
-        total_indicator=outflow_indicators["bilateral_int"][0],
-        concessional_indicator=outflow_indicators["bilateral_int"][1],
-        indicator_prefix="bilateral",
-    )
-
-    # get multilateral amt data, split by concessional and non-concessional
-    multilateral_amt = get_concessional_non_concessional(
-        start_year=config.ANALYSIS_YEARS[0],
-        end_year=config.ANALYSIS_YEARS[1] + PROJECTIONS_YEARS,
-        total_indicator=outflow_indicators["multilateral_amt"][0],
-        concessional_indicator=outflow_indicators["multilateral_amt"][1],
-        indicator_prefix="multilateral",
-    )
-    # get multilateral int data, split by concessional and non-concessional
-    multilateral_int = get_concessional_non_concessional(
-        start_year=config.ANALYSIS_YEARS[0],
-        end_year=config.ANALYSIS_YEARS[1] + PROJECTIONS_YEARS,
-        total_indicator=outflow_indicators["multilateral_int"][0],
-        concessional_indicator=outflow_indicators["multilateral_int"][1],
-        indicator_prefix="multilateral",
+    start_year = config.ANALYSIS_YEARS[0]
+    end_year = config.ANALYSIS_YEARS[1] + PROJECTIONS_YEARS
+
+    # get bilateral and multilateral amt and int data, split by concessional and
+    # non-concessional. The loads run one after the other, as bblocks' IDS data
+    # folder is not safe to share between threads.
+    bilateral_amt, bilateral_int, multilateral_amt, multilateral_int = (
+        get_concessional_non_concessional(
+            start_year=start_year,
+            end_year=end_year,
+            total_indicator=outflow_indicators[f"{prefix}_{flow}"][0],
+            concessional_indicator=outflow_indicators[f"{prefix}_{flow}"][1],
+            indicator_prefix=prefix,
+        )
+        for prefix in ["bilateral", "multilateral"]
+        for flow in ["amt", "int"]
     )
 
     # Load bonds, banks, and other private
-    ids = DebtIDS().load_data(
-        indicators=[
-            outflow_indicators["bonds_amt"],
-            outflow_indicators["banks_amt"],
-            outflow_indicators["other_private_amt"],
-            outflow_indicators["bonds_int"],
-            outflow_indicators["banks_int"],
-            outflow_indicators["other_private_int"],
-        ],
-        start_year=config.ANALYSIS_YEARS[0],
-        end_year=config.ANALYSIS_YEARS[1] + PROJECTIONS_YEARS,
-    )
-
-    # Get bonds data
-    bonds = ids.get_data(
-        [outflow_indicators["bonds_amt"], outflow_indicators["bonds_int"]]
-    ).pipe(filter_and_assign_indicator, "bonds")
-
-    # Get banks data
-    banks = ids.get_data(
-        [outflow_indicators["banks_amt"], outflow_indicators["banks_int"]]
-    ).pipe(filter_and_assign_indicator, "banks")
-
-    # Get other private data
-    other_private = ids.get_data(
-        [
-            outflow_indicators["other_private_amt"],
-            outflow_indicators["other_private_int"],
-        ]
-    ).pipe(filter_and_assign_indicator, "other_private")
+    private = _get_private_debt_service(start_year, end_year)
 
     # combine
     data = (
@@ -116,9 +90,7 @@ def get_debt_service_data(constant: bool = False) -> pd.DataFrame:
                 bilateral_int,
                 multilateral_amt,
                 multilateral_int,
-                bonds,
-                banks,
-                other_private,
+                private,
             ],
             ignore_index=True,
         )
@@ -1,5 +1,9 @@
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
 import pandas as pd
-from bblocks import add_iso_codes_column
+from bblocks import convert_id
 
 from scripts.config import Paths
 
@@ -44,10 +48,30 @@ def clean_column_names(columns: pd.Index) -> pd.Index:
     )
 
 
+def _ensure_parquet(xlsx_path: Path, **read_kwargs) -> Path:
+    """Write a parquet copy of an Excel file next to it, unless an up-to-date one
+    exists, and return its path. Extra arguments are passed to read_excel."""
+    parquet_path = xlsx_path.with_suffix(".parquet")
+
+    if (
+        not parquet_path.exists()
+        or parquet_path.stat().st_mtime < xlsx_path.stat().st_mtime
+    ):
+        pd.read_excel(xlsx_path, **read_kwargs).to_parquet(
+            parquet_path, engine="pyarrow", compression="zstd"
+        )
+
+    return parquet_path
+
+
+@lru_cache(maxsize=None)
 def read_projections() -> pd.DataFrame:
-    """Read the SEEK projections data."""
-    data = pd.read_excel(
-        Paths.models / SEEK_FILE, sheet_name="Projections constant 2023 price"
+    """Read the SEEK projections data. The result is cached, so do not modify it."""
+    data = pd.read_parquet(
+        _ensure_parquet(
+            Paths.models / SEEK_FILE, sheet_name="Projections constant 2023 price"
+        ),
+        engine="pyarrow",
     )
 
     # Clean column names
@@ -67,10 +91,22 @@ def get_seek_indicator(indicator: str) -> pd.DataFrame:
     return df
 
 
+@lru_cache(maxsize=None)
 def load_deflators():
-    return pd.read_excel(Paths.models / "deflators_one.xlsx")[
-        ["year", "iso_code", "usd_usd_deflator"]
-    ]
+    return pd.read_parquet(
+        _ensure_parquet(Paths.models / "deflators_one.xlsx"),
+        columns=["year", "iso_code", "usd_usd_deflator"],
+        engine="pyarrow",
+    )
+
+
+@lru_cache(maxsize=None)
+def _seek_donor_to_iso() -> dict:
+    """Map the SEEK donor names to ISO3 codes (from bblocks), resolving each name once.
+    Names that can't be matched are kept as they are."""
+    donors = pd.Series(read_projections()["donor"].unique())
+
+    return dict(zip(donors, convert_id(donors, from_type="regex", to_type="ISO3")))
 
 
 def extract_decreases():
@@ -78,7 +114,7 @@ def extract_decreases():
 
     data = (
         get_seek_indicator("oda")
-        .pipe(add_iso_codes_column, id_column="donor", id_type="regex")
+        .assign(iso_code=lambda d: d["donor"].map(_seek_donor_to_iso()))
         .merge(load_deflators(), how="left", on=["year", "iso_code"])
         .sort_values(["donor", "year"])
     )
@@ -97,15 +133,16 @@ def extract_decreases():
         "iso_code"
     )
 
-    # Merge baseline back into the full dataset
-    for scenario in scenarios:
-        data = data.merge(
-            baseline[[scenario]].rename(columns={scenario: f"{scenario}_2023"}),
-            how="left",
-            on="iso_code",
-        )
-        # Compute multiplicative factor
-        data[f"{scenario}_multiplier"] = data[scenario] / data[f"{scenario}_2023"]
+    # Join the baseline for all scenarios back into the full dataset at once
+    data = data.join(baseline.add_suffix("_2023"), on="iso_code").reset_index(drop=True)
+
+    # Compute multiplicative factor
+    data = data.assign(
+        **{
+            f"{scenario}_multiplier": data[scenario] / data[f"{scenario}_2023"]
+            for scenario in scenarios
+        }
+    )
 
     data = data.dropna(subset=[f"{scenario}_multiplier" for scenario in scenarios])
 
@@ -134,20 +171,14 @@ def apply_linear_reduction(
     Returns:
         DataFrame with an additional column applying the linear reduction.
     """
-    data = data.copy()
-    data[output_col] = data[multiplier_col]
-
     num_years = end_year - start_year + 1
     if num_years <= 0:
         raise ValueError("end_year must be greater than or equal to start_year.")
 
-    for i, year in enumerate(range(start_year, end_year + 1)):
-        year_reduction = reduction * ((i + 1) / num_years)
-        mask = data["year"] == year
-        data.loc[mask, output_col] = data.loc[mask, multiplier_col] - year_reduction
+    # Share of the reduction reached by each row's year: none before start_year,
+    # growing linearly to the full reduction at end_year and constant after that
+    steps = np.clip(data["year"].to_numpy() - start_year + 1, 0, num_years)
 
-    # Apply full reduction from end_year + 1 onwards
-    mask_later = data["year"] > end_year
-    data.loc[mask_later, output_col] = data.loc[mask_later, multiplier_col] - reduction
-
-    return data
+    return data.assign(
+        **{output_col: data[multiplier_col] - reduction * (steps / num_years)}
+    )
@@ -1,5 +1,7 @@
+import time
 from functools import lru_cache
 
+import numpy as np
 import pandas as pd
 from bblocks import add_income_level_column
 from pydeflate import set_pydeflate_path, imf_gdp_deflate
@@ -11,6 +13,32 @@ from scripts.data.common import clean_debtors, clean_creditors, add_counterpart_
 
 set_pydeflate_path(config.Paths.raw_data)
 
+# How long a World Bank indicator saved to raw_data is reused, in seconds
+WB_CACHE_TTL = 7 * 24 * 60 * 60
+
+
+# pydeflate rounds its output to 6 decimals, so price factors are computed on this
+# constant and scaled back, to keep them at full precision
+_FACTOR_SCALE = 1e12
+
+
+@lru_cache
+def _price_factors(base_year: int, keys: tuple) -> np.ndarray:
+    """Constant price factors (from IMF WEO data) for each (iso_code, year) pair
+    in keys, in the same order. The result is cached, so do not modify it."""
+    pairs = pd.DataFrame(list(keys), columns=["iso_code", "year"]).assign(
+        position=range(len(keys)), value=_FACTOR_SCALE
+    )
+
+    deflated = imf_gdp_deflate(data=pairs, base_year=base_year, year_column="year")
+
+    return (
+        deflated.set_index("position")["value"]
+        .sort_index()
+        .to_numpy(dtype="float64", na_value=np.nan)
+        / _FACTOR_SCALE
+    )
+
 
 def to_constant_prices(data: pd.DataFrame, base_year: int) -> pd.DataFrame:
     """
@@ -27,14 +55,44 @@ def to_constant_prices(data: pd.DataFrame, base_year: int) -> pd.DataFrame:
 
     """
 
-    # Pass the data to the deflate function and assign a prices column
-    data = imf_gdp_deflate(data=data, base_year=base_year, year_column="year").assign(
-        prices="constant"
+    # Deflate each distinct (iso_code, year) pair once, then map the factors back
+    keys = pd.MultiIndex.from_frame(data[["iso_code", "year"]])
+    unique_keys = keys.unique()
+    factors = _price_factors(base_year, tuple(unique_keys))[
+        unique_keys.get_indexer(keys)
+    ]
+
+    # Apply the factors and assign a prices column
+    return data.assign(
+        value=(data["value"] * factors).round(6),
+        prices="constant",
     )
 
+
+def _year_as_int(data: pd.DataFrame) -> pd.DataFrame:
+    """Convert a datetime year column to an integer, unless it already is one"""
+    if pd.api.types.is_datetime64_any_dtype(data["year"]):
+        return data.assign(year=data["year"].dt.year.astype("int16"))
+
     return data
 
 
+def _drop_missing_and_zero(data: pd.DataFrame) -> pd.DataFrame:
+    """Drop missing values and values which are zero, in a single pass"""
+    values = data["value"].to_numpy(dtype="float64", na_value=np.nan)
+
+    return data.iloc[~np.isnan(values) & (values != 0)]
+
+
+def _add_income_level(data: pd.DataFrame) -> pd.DataFrame:
+    """Add an income level column, looking up each distinct iso_code once"""
+    income_levels = add_income_level_column(
+        data[["iso_code"]].drop_duplicates(), id_column="iso_code", id_type="ISO3"
+    )
+
+    return data.merge(income_levels, on="iso_code", how="left")
+
+
 def clean_debt_output(data: pd.DataFrame) -> pd.DataFrame:
     """
     Cleans the output data frame by replacing bad characters and
@@ -45,28 +103,24 @@ def clean_debt_output(data: pd.DataFrame) -> pd.DataFrame:
 
 
     """
-    # replace bad characters
-    data["counterpart_area"] = data["counterpart_area"].str.strip()
-
-    # clean debtors
-    data = clean_debtors(data, "country")
-
-    # clean creditors
-    data = clean_creditors(data, "counterpart_area")
+    # Use arrow strings for the name columns, so string operations run in C
+    strings = {
+        column: "string[pyarrow]"
+        for column in ("counterpart_area", "country", "iso_code")
+        if column in data
+    }
 
-    # Convert the year to an integer
-    data.year = data.year.dt.year
-
-    # add income level
-    data = add_income_level_column(data, id_column="iso_code", id_type="ISO3")
-
-    # drop missing values and values which are zero
-    data = data.dropna(subset=["value"]).loc[lambda d: d.value != 0]
-
-    # add counterpart type
-    data = add_counterpart_type(data)
-
-    return data
+    return (
+        data.astype(strings)
+        # replace bad characters
+        .assign(counterpart_area=lambda d: d["counterpart_area"].str.strip())
+        .pipe(clean_debtors, "country")
+        .pipe(clean_creditors, "counterpart_area")
+        .pipe(_year_as_int)
+        .pipe(_add_income_level)
+        .pipe(_drop_missing_and_zero)
+        .pipe(add_counterpart_type)
+    )
 
 
 def custom_sort(df: pd.DataFrame, col: str, custom_list: list) -> pd.DataFrame:
@@ -82,59 +136,89 @@ def custom_sort(df: pd.DataFrame, col: str, custom_list: list) -> pd.DataFrame:
 
     """
 
-    def sorting_key(value):
-        # If the value is in the custom list, return its index, otherwise return a large number
-        return (
-            custom_list.index(value) if value in custom_list else len(custom_list),
-            str(value),
-        )
+    # Position of each value in the custom list. Other values go after them.
+    custom_rank = {value: custom_list.index(value) for value in custom_list}
+
+    # Encode the column once and rank its distinct values, instead of computing a
+    # key for every row
+    codes, uniques = pd.factorize(df[col], use_na_sentinel=False)
+    keys = [(custom_rank.get(value, len(custom_list)), str(value)) for value in uniques]
+
+    order = sorted(range(len(uniques)), key=keys.__getitem__)
+    unique_rank = np.empty(len(uniques), dtype=np.intp)
+    unique_rank[order] = np.arange(len(order))
 
-    # Sort the DataFrame using the custom key
-    df = df.loc[sorted(df.index, key=lambda x: sorting_key(df.loc[x, col]))]
+    # Sort the DataFrame by the rank of each row (stable, to keep ties in order)
+    df = df.iloc[np.argsort(unique_rank[codes], kind="stable")]
     return df.reset_index(drop=True)
 
 
-@lru_cache
-def get_gni():
-    """Get a dataframe with GNI values"""
+def _read_wb_indicator(indicator: str) -> pd.DataFrame:
+    """Get year, entity_code and value for a World Bank indicator. A parquet copy
+    in raw_data is reused until it is older than WB_CACHE_TTL."""
+    path = config.Paths.raw_data / f"wb_{indicator}.parquet"
 
-    wb = bbdata.WorldBank()
+    if path.exists() and time.time() - path.stat().st_mtime < WB_CACHE_TTL:
+        return pd.read_parquet(path, engine="pyarrow")
+
+    # Compact columns keep the cache small and the join keys cheap
+    data = (
+        bbdata.WorldBank()
+        .get_data(indicator)
+        .filter(["year", "entity_code", "value"])
+        .astype({"year": "int16", "entity_code": "category"})
+    )
+    data.to_parquet(path, engine="pyarrow", compression="zstd", index=False)
+
+    return data
+
+
+@lru_cache
+def get_gni() -> pd.Series:
+    """Get a series with GNI values, indexed by year and entity_code"""
 
     return (
-        wb.get_data("NY.GNP.ATLS.CD")
-        .loc[:, ["year", "entity_code", "value"]]
-        .rename(columns={"value": "gni"})
+        _read_wb_indicator("NY.GNP.ATLS.CD")
+        .set_index(["year", "entity_code"])["value"]
+        .rename("gni")
     )
 
 
 def add_gni(df):
     """ """
 
+    # Nothing to look up for an empty DataFrame
+    if df.empty:
+        return df.assign(gni=np.nan)
+
     gni = get_gni()
 
-    # Merge the GNI data with the original DataFrame
-    return df.merge(gni, how="left", on=["year", "entity_code"])
+    # Join the GNI data to the original DataFrame
+    return df.join(gni, how="left", on=["year", "entity_code"]).reset_index(drop=True)
 
 
 @lru_cache
-def get_gni_pc():
-    """Get a dataframe with GNI per capita values"""
-
-    wb = bbdata.WorldBank()
+def get_gni_pc() -> pd.Series:
+    """Get a series with GNI per capita values, indexed by year and entity_code"""
 
-    # Get GNI per capita data from World Bank
     return (
-        wb.get_data("NY.GNP.PCAP.CD")
-        .loc[:, ["year", "entity_code", "value"]]
-        .rename(columns={"value": "gni_pc"})
+        _read_wb_indicator("NY.GNP.PCAP.CD")
+        .set_index(["year", "entity_code"])["value"]
+        .rename("gni_pc")
     )
 
 
 def add_gni_pc(df):
     """ """
 
+    # Nothing to look up for an empty DataFrame
+    if df.empty:
+        return df.assign(gni_pc=np.nan)
+
     # Get GNI per capita data
     gni_pc = get_gni_pc()
 
-    # Merge the GNI per capita data with the original DataFrame
-    return df.merge(gni_pc, how="left", on=["year", "entity_code"])
+    # Join the GNI per capita data to the original DataFrame
+    return df.join(gni_pc, how="left", on=["year", "entity_code"]).reset_index(
+        drop=True
+    )